@@ -0,0 +1,65 @@
+"""
+Benchmark for ranked (top-K) queries.
+
+Compares sorting every product in user code with Inventory.top_k, both as a
+one-off heap query and with a tracked ranking index.
+
+Run from the project root:
+    python -m benchmarks.bench_ranked_queries
+"""
+import random
+import timeit
+
+from inventory import Inventory
+from products.laptop import Laptop
+from products.smartphone import Smartphone
+
+CATALOG_SIZE = 100_000
+K = 10
+REPEATS = 20
+
+
+def build_inventory() -> Inventory:
+    """Creates an inventory of laptops and smartphones with random prices and discounts."""
+    random.seed(42)
+    inventory = Inventory('Benchmark Store')
+    for index in range(CATALOG_SIZE):
+        price = random.randint(100, 5000)
+        if index % 2:
+            product = Laptop('Laptop', price, 5000, 'Intel Core i7-12700H', 16)
+        else:
+            product = Smartphone('Phone', price, '5.3', '802.11ax', 4800, 6.7, 108)
+        product.apply_discount(random.randint(0, 50))
+        inventory.add_product(product)
+    return inventory
+
+
+def sort_everything(inventory:Inventory) -> list:
+    """The previous approach: sort all products and take the first K."""
+    products = sorted(inventory.products.values(), key=lambda product: product.price, reverse=True)
+    return products[:K]
+
+
+def main():
+    inventory = build_inventory()
+    expected = [product.price for product in sort_everything(inventory)]
+    assert [product.price for product in inventory.top_k('price', K)] == expected
+
+    sort_time = timeit.timeit(lambda: sort_everything(inventory), number=REPEATS) / REPEATS
+    heap_time = timeit.timeit(lambda: inventory.top_k('price', K), number=REPEATS) / REPEATS
+    build_time = timeit.timeit(lambda: inventory.track_ranking('price'), number=1)
+    assert [product.price for product in inventory.top_k('price', K)] == expected
+    index_time = timeit.timeit(lambda: inventory.top_k('price', K), number=REPEATS) / REPEATS
+
+    product = inventory.find_product(CATALOG_SIZE // 2)
+    update_time = timeit.timeit(lambda: product.apply_discount(1), number=1_000) / 1_000
+
+    print(f'Top {K} most expensive of {CATALOG_SIZE} products:')
+    print(f'  full sort:        {sort_time * 1000:8.2f} ms')
+    print(f'  heap (one-off):   {heap_time * 1000:8.2f} ms')
+    print(f'  tracked index:    {index_time * 1000:8.4f} ms (built once in {build_time * 1000:.2f} ms)')
+    print(f'  index update per price change: {update_time * 1_000_000:.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark for the shared spec code tables.
+
+Builds a catalog of real Smartphone objects and compares it with the same catalog
+using the previous per-object layout, where every phone kept its own Bluetooth and
+Wi-Fi version strings and formatted them on every access.
+
+Only the closed Bluetooth and Wi-Fi tables are used, so the benchmark does not add
+anything to the shared tables.
+
+Run from the project root:
+    python -m benchmarks.bench_spec_tables
+"""
+import gc
+import timeit
+import tracemalloc
+
+from features.connectable import Connectable
+from products.smartphone import Smartphone
+
+CATALOG_SIZE = 50_000
+
+
+class LegacySmartphone(Smartphone):
+    """A Smartphone that stores and formats its Bluetooth and Wi-Fi versions as before the code tables."""
+    @property
+    def bluetooth_version(self) -> str:
+        key = self.__bluetooth_version
+        value = Connectable.BLUETOOTH_VERSIONS[self.__bluetooth_version]
+        return f'{key}: {value}'
+
+    @bluetooth_version.setter
+    def bluetooth_version(self, value:str):
+        string_value = str(value)
+        if string_value not in Connectable.BLUETOOTH_VERSIONS:
+            raise ValueError('Invalid bluetooth version.')
+        self.__bluetooth_version = string_value
+
+    @property
+    def wifi_standard(self) -> str:
+        key = self.__wifi_standard
+        value = Connectable.WIFI_STANDARDS[self.__wifi_standard]
+        return f'{key}: {value}'
+
+    @wifi_standard.setter
+    def wifi_standard(self, value:str) -> None:
+        string_value = str(value)
+        if string_value not in Connectable.WIFI_STANDARDS:
+            raise ValueError('Invalid Wi-Fi version.')
+        self.__wifi_standard = string_value
+
+
+def spec_rows(count:int):
+    """Yields Bluetooth and Wi-Fi versions as fresh string objects, as if read from a file."""
+    bluetooth = list(Connectable.BLUETOOTH_VERSIONS)
+    wifi = list(Connectable.WIFI_STANDARDS)
+    for index in range(count):
+        yield ''.join(bluetooth[index % len(bluetooth)]), ''.join(wifi[index % len(wifi)])
+
+
+def measure_memory(phone_class) -> int:
+    """
+    Returns the bytes still allocated after building a catalog of phones.
+    Input strings are created while tracing and only survive if the phones keep them.
+    """
+    gc.collect()
+    tracemalloc.start()
+    catalog = [phone_class('Phone', 900, bluetooth, wifi, 4800, 6.7, 108)
+               for bluetooth, wifi in spec_rows(CATALOG_SIZE)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return size
+
+
+def measure_getter(phone_class) -> float:
+    """Returns the time of one million bluetooth_version reads."""
+    phone = phone_class('Galaxy Supernova', 1950, '5.3', '802.11ax', 4800, 6.7, 108)
+    return timeit.timeit(lambda: phone.bluetooth_version, number=1_000_000)
+
+
+def main():
+    legacy_bytes = measure_memory(LegacySmartphone)
+    coded_bytes = measure_memory(Smartphone)
+    print(f'Memory of a catalog of {CATALOG_SIZE} smartphones:')
+    print(f'  per-object strings: {legacy_bytes / 1024:.0f} KiB')
+    print(f'  shared code tables: {coded_bytes / 1024:.0f} KiB')
+
+    legacy_time = measure_getter(LegacySmartphone)
+    coded_time = measure_getter(Smartphone)
+    print('bluetooth_version getter, 1,000,000 reads:')
+    print(f'  formatted on access: {legacy_time:.3f}s')
+    print(f'  precomputed label:   {coded_time:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark for inventory transactions.
+
+Measures the overhead of running a batch of edits inside Inventory.transaction()
+on the common commit path, and the cost of rolling the same batch back.
+
+The baseline runs the batch with no transaction and no tracked rankings. In that case
+no observers are attached to the products, so it matches the code path from before
+transactions existed. The run checks this before timing anything.
+
+Run from the project root:
+    python -m benchmarks.bench_transactions
+"""
+import gc
+import time
+
+from inventory import Inventory
+from products.laptop import Laptop
+from products.smartphone import Smartphone
+
+BATCH_SIZE = 20_000
+REPEATS = 7
+
+
+def build_batch() -> list:
+    """Creates the products added by one batch."""
+    batch = []
+    for index in range(BATCH_SIZE):
+        if index % 2:
+            batch.append(Laptop('Laptop', 1500, 5000, 'Intel Core i7-12700H', 16))
+        else:
+            batch.append(Smartphone('Phone', 900, '5.3', '802.11ax', 4800, 6.7, 108))
+    return batch
+
+
+def run_batch(inventory:Inventory, batch:list) -> None:
+    """Adds the batch, discounts it, upgrades the laptops and removes a clearance set."""
+    for product in batch:
+        inventory.add_product(product)
+    for product in batch:
+        product.apply_discount(10)
+        if isinstance(product, Laptop):
+            product.ram = 32
+    for product in batch[::4]:
+        inventory.remove_product(product.product_id)
+
+
+def check_baseline_has_no_observers() -> None:
+    """Fails if products outside a transaction still call back into the inventory."""
+    inventory = Inventory('Benchmark Store')
+    batch = build_batch()
+    run_batch(inventory, batch)
+    if any(product._observers for product in batch):
+        raise AssertionError('The no-transaction baseline has observers attached.')
+
+
+def count_logged_edits(batch:list) -> int:
+    """Returns the number of undo entries the batch records: adds, discounts, RAM changes and removals."""
+    laptops = sum(isinstance(product, Laptop) for product in batch)
+    return 2 * len(batch) + laptops + len(batch[::4])
+
+
+def measure(use_transaction:bool, commit:bool = True) -> float:
+    """Returns the best time of running one batch, optionally inside a transaction."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        inventory = Inventory('Benchmark Store')
+        batch = build_batch()
+        gc.collect()
+        start = time.perf_counter()
+        if not use_transaction:
+            run_batch(inventory, batch)
+        else:
+            with inventory.transaction() as transaction:
+                run_batch(inventory, batch)
+                if not commit:
+                    transaction.rollback()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    check_baseline_has_no_observers()
+    edits = count_logged_edits(build_batch())
+    plain = measure(use_transaction=False)
+    committed = measure(use_transaction=True)
+    rolled_back = measure(use_transaction=True, commit=False)
+    print(f'Batch of {BATCH_SIZE} products (add, discount, upgrade RAM, remove 25%), {edits} logged edits:')
+    print(f'  no transaction, no observers: {plain * 1000:8.2f} ms')
+    print(f'  committed transaction:        {committed * 1000:8.2f} ms '
+          f'(+{(committed - plain) * 1000:.2f} ms, {(committed - plain) / edits * 1_000_000:.2f} us per edit)')
+    print(f'  rolled back:                  {rolled_back * 1000:8.2f} ms '
+          f'(+{(rolled_back - plain) * 1000:.2f} ms, {(rolled_back - plain) / edits * 1_000_000:.2f} us per edit)')
+
+
+if __name__ == '__main__':
+    main()
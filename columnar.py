@@ -0,0 +1,242 @@
+"""
+Columnar export and import of inventory products using NumPy .npz archives.
+
+Each product type is stored as its own table. Every column is written in chunks of
+at most `chunk_size` rows, as separate arrays named '<table>.<column>.<chunk>', so
+memory stays bounded while writing and reading. Spec fields backed by a SpecTable are
+stored as integer codes together with a '<table>.<column>.dictionary' array of values.
+Price histories are stored flattened, with per-row offsets in '<table>.price_history_offsets'.
+"""
+import os
+import zipfile
+
+import numpy as np
+
+from features.connectable import Connectable
+from products.electronics import Electronics
+from products.gaming_console import GamingConsole
+from products.laptop import Laptop
+from products.product import Product
+from products.smartphone import Smartphone
+
+DEFAULT_CHUNK_SIZE = 10_000
+FORMAT_VERSION = 1
+
+# (column name, dtype or SpecTable for dictionary encoded columns, getter)
+PRODUCT_COLUMNS = [
+    ('product_id', 'int64', lambda product: product.product_id),
+    ('name', 'str', lambda product: product.name),
+    ('price', 'float64', lambda product: product.price),
+]
+ELECTRONICS_COLUMNS = PRODUCT_COLUMNS + [
+    ('warranty_period', 'int16', lambda product: product.warranty_period),
+    ('purchase_date', 'datetime64[D]', lambda product: product.purchase_date),
+]
+BATTERY_COLUMNS = [
+    ('battery_capacity_mah', 'int64', lambda product: product.battery_capacity_mah),
+    ('charge_percentage', 'int8', lambda product: product.current_charge_percentage),
+]
+LAPTOP_COLUMNS = ELECTRONICS_COLUMNS + BATTERY_COLUMNS + [
+    ('processor', Laptop.PROCESSORS, lambda product: product.processor_code),
+    ('ram', 'int16', lambda product: product.ram),
+]
+SMARTPHONE_COLUMNS = ELECTRONICS_COLUMNS + BATTERY_COLUMNS + [
+    ('bluetooth_version', Connectable.BLUETOOTH_TABLE, lambda product: product.bluetooth_code),
+    ('wifi_standard', Connectable.WIFI_TABLE, lambda product: product.wifi_code),
+    ('screen_size', 'float64', lambda product: product.screen_size),
+    ('camera_megapixels', 'int64', lambda product: product.camera_megapixels),
+]
+GAMING_CONSOLE_COLUMNS = ELECTRONICS_COLUMNS + [
+    ('controller_type', GamingConsole.CONTROLLER_TYPES, lambda product: product.controller_code),
+    ('storage_gb', 'int16', lambda product: product.storage_gb),
+]
+
+# table name -> (product class, columns, factory building a product from a row)
+TABLES = {
+    'product': (Product, PRODUCT_COLUMNS,
+                lambda row: Product(row['name'], row['price'])),
+    'electronics': (Electronics, ELECTRONICS_COLUMNS,
+                    lambda row: Electronics(row['name'], row['price'])),
+    'laptop': (Laptop, LAPTOP_COLUMNS,
+               lambda row: Laptop(row['name'], row['price'], row['battery_capacity_mah'],
+                                  row['processor'], row['ram'])),
+    'smartphone': (Smartphone, SMARTPHONE_COLUMNS,
+                   lambda row: Smartphone(row['name'], row['price'], row['bluetooth_version'],
+                                          row['wifi_standard'], row['battery_capacity_mah'],
+                                          row['screen_size'], row['camera_megapixels'])),
+    'gaming_console': (GamingConsole, GAMING_CONSOLE_COLUMNS,
+                       lambda row: GamingConsole(row['name'], row['price'],
+                                                 row['controller_type'], row['storage_gb'])),
+}
+TABLE_NAMES = {product_class: table for table, (product_class, _, _) in TABLES.items()}
+
+
+def _write_array(archive:zipfile.ZipFile, key:str, array:np.ndarray) -> None:
+    """Writes a single array into the archive as '<key>.npy'."""
+    with archive.open(f'{key}.npy', 'w', force_zip64=True) as file:
+        np.lib.format.write_array(file, array, allow_pickle=False)
+
+
+def _chunks(products, chunk_size:int):
+    """Yields lists of at most chunk_size products."""
+    chunk = []
+    for product in products:
+        chunk.append(product)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def export_products(products, path, chunk_size:int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Writes products to a columnar .npz archive, one table per product type.
+    Only the exact classes in TABLES are supported. Subclasses raise TypeError
+    instead of being stored as their base class and losing their own state.
+
+    :param products: A collection of products to export.
+    :param path: The path of the archive to create.
+    :param chunk_size: The maximum number of rows held in memory per chunk.
+    """
+    if chunk_size <= 0:
+        raise ValueError('Chunk size must be a positive number.')
+    products = list(products)
+    for product in products:
+        if type(product) not in TABLE_NAMES:
+            raise TypeError(f'Unsupported product type: {type(product).__name__}')
+
+    # Write next to the target and rename it into place, so a failed export never leaves a partial archive
+    temporary_path = f'{os.fspath(path)}.tmp'
+    try:
+        with zipfile.ZipFile(temporary_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+            _write_tables(archive, products, chunk_size)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _write_tables(archive:zipfile.ZipFile, products:list, chunk_size:int) -> None:
+    """Writes the format version and every product table into an open archive."""
+    _write_array(archive, 'format_version', np.array(FORMAT_VERSION))
+    for table, (product_class, columns, _) in TABLES.items():
+        table_products = (product for product in products if type(product) is product_class)
+        for index, chunk in enumerate(_chunks(table_products, chunk_size)):
+            for column, dtype, getter in columns:
+                dtype = 'int32' if not isinstance(dtype, str) else dtype
+                _write_array(archive, f'{table}.{column}.{index:05d}',
+                             np.array([getter(product) for product in chunk], dtype=dtype))
+
+            lengths = [len(product.price_history) for product in chunk]
+            history = [price for product in chunk for price in product.price_history]
+            _write_array(archive, f'{table}.price_history.{index:05d}', np.array(history, dtype='float64'))
+            _write_array(archive, f'{table}.price_history_offsets.{index:05d}',
+                         np.concatenate(([0], np.cumsum(lengths, dtype='int64'))))
+
+        for column, dtype, _ in columns:
+            if not isinstance(dtype, str):
+                _write_array(archive, f'{table}.{column}.dictionary', np.array(dtype.values, dtype='str'))
+
+
+def _check_format_version(archive) -> None:
+    """Raises ValueError unless the archive was written in the current format version."""
+    if 'format_version' not in archive.files:
+        raise ValueError('The archive has no format version and was not written by export_products.')
+    version = int(archive['format_version'])
+    if version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported archive format version {version}. Expected {FORMAT_VERSION}.')
+
+
+def _chunk_keys(archive, table:str, column:str) -> list[str]:
+    """Returns the sorted chunk keys of a column in an opened archive."""
+    prefix = f'{table}.{column}.'
+    return sorted(key for key in archive.files if key.startswith(prefix) and key[len(prefix):].isdigit())
+
+
+def _read_chunk(archive, table:str, columns, index:int) -> dict:
+    """Reads the given columns of a single chunk, decoding dictionary encoded columns."""
+    chunk = {}
+    for column, dtype, _ in columns:
+        if column == 'price_history':
+            values = archive[f'{table}.price_history.{index:05d}']
+            offsets = archive[f'{table}.price_history_offsets.{index:05d}']
+            chunk[column] = np.split(values, offsets[1:-1])
+            continue
+        array = archive[f'{table}.{column}.{index:05d}']
+        if not isinstance(dtype, str):
+            array = archive[f'{table}.{column}.dictionary'][array]
+        chunk[column] = array
+    return chunk
+
+
+def _select_columns(table:str, columns:list[str] | None) -> list:
+    """Returns the column definitions of a table, limited to the requested names."""
+    if table not in TABLES:
+        raise ValueError(f'Unknown table: {table}')
+    available = TABLES[table][1] + [('price_history', 'float64', None)]
+    if columns is None:
+        return available
+    by_name = {definition[0]: definition for definition in available}
+    unknown = [column for column in columns if column not in by_name]
+    if unknown:
+        raise ValueError(f'Unknown columns for table {table}: {", ".join(unknown)}')
+    return [by_name[column] for column in columns]
+
+
+def read_columns(path, table:str, columns:list[str] | None = None) -> dict:
+    """
+    Reads selected columns of one table without constructing any products.
+
+    :param path: The path of the archive to read.
+    :param table: The table name, e.g. 'laptop' or 'smartphone'.
+    :param columns: The column names to read. Reads all columns if None.
+    :return: A dictionary of column name to NumPy array. 'price_history'
+             is returned as a list with one array per row.
+    """
+    selected = _select_columns(table, columns)
+    with np.load(path, allow_pickle=False) as archive:
+        _check_format_version(archive)
+        chunk_count = len(_chunk_keys(archive, table, 'product_id'))
+        chunks = [_read_chunk(archive, table, selected, index) for index in range(chunk_count)]
+
+    result = {}
+    for column, dtype, _ in selected:
+        if column == 'price_history':
+            result[column] = [history for chunk in chunks for history in chunk[column]]
+        elif chunks:
+            result[column] = np.concatenate([chunk[column] for chunk in chunks])
+        else:
+            result[column] = np.empty(0, dtype=dtype if isinstance(dtype, str) else 'str')
+    return result
+
+
+def import_products(path):
+    """
+    Reads all products back from a columnar .npz archive, one chunk at a time.
+
+    Restores product IDs, price histories, warranty and battery state. Prices come back
+    as floats. Smartphone connection state (connected flag and wifi_name) is not stored,
+    so restored smartphones are disconnected.
+    :param path: The path of the archive to read.
+    :return: A generator of restored products.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        _check_format_version(archive)
+        for table, (_, columns, factory) in TABLES.items():
+            selected = _select_columns(table, None)
+            for index in range(len(_chunk_keys(archive, table, 'product_id'))):
+                chunk = _read_chunk(archive, table, selected, index)
+                rows = {column: chunk[column].tolist() for column, _, _ in columns}
+                histories = chunk['price_history']
+                for position in range(len(histories)):
+                    row = {column: values[position] for column, values in rows.items()}
+                    product = factory(row)
+                    product._restore_id(row['product_id'])
+                    product.price_history = histories[position].tolist()
+                    if isinstance(product, Electronics):
+                        product._restore_warranty(row['warranty_period'], row['purchase_date'])
+                    if 'charge_percentage' in row:
+                        product._restore_charge(row['charge_percentage'])
+                    yield product
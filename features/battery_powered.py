@@ -1,4 +1,7 @@
-class BatteryPowered:
+from features.observable import Observable
+
+
+class BatteryPowered(Observable):
     """
     Representing devices that are powered by a battery.
     Provides functionality for charging, usage, and status monitoring.
@@ -33,13 +36,32 @@ class BatteryPowered:
             raise ValueError('Battery capacity must be a integer value.')
         if value <= 0:
             raise ValueError('Battery capacity must be a positive number.')
+        old_capacity = self.__battery_capacity_mah if self._observers else None
         self.__battery_capacity_mah = value
+        self._notify('battery_capacity_mah', old_capacity)
+
+
+
+    def _restore_charge(self, percentage:int) -> None:
+        """Restores the charge percentage, e.g. when loading a saved inventory."""
+        self.__current_charge_percentage = percentage
+
 
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the battery capacity or charge, e.g. when undoing a change."""
+        if attribute == 'battery_capacity_mah':
+            self.__battery_capacity_mah = old_value
+        elif attribute == 'current_charge_percentage':
+            self.__current_charge_percentage = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
 
 
     def charge(self) -> None:
         """Fully charges the battery to 100%."""
+        old_charge = self.__current_charge_percentage if self._observers else None
         self.__current_charge_percentage = BatteryPowered.BATTERY_FULLY_CHAGRE
+        self._notify('current_charge_percentage', old_charge)
 
 
     def use_device(self, hours:int, power:int) -> int:
@@ -49,14 +71,17 @@ class BatteryPowered:
         returns a negative number representing the time deficit in hours.
         """ 
         required_energy = power * hours
+        old_charge = self.__current_charge_percentage if self._observers else None
         available_energy = self.__battery_capacity_mah * (self.__current_charge_percentage / 100)
 
         if required_energy > available_energy:    
             self.__current_charge_percentage = 0    
+            self._notify('current_charge_percentage', old_charge)
             return (available_energy / power) - hours
 
         battery_consumption = available_energy - (power * hours) 
         self.__current_charge_percentage = int((battery_consumption / self.__battery_capacity_mah) * 100)
+        self._notify('current_charge_percentage', old_charge)
         return hours
 
 
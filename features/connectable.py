@@ -1,4 +1,8 @@
-class Connectable:
+from features.observable import Observable
+from features.spec_table import SpecTable
+
+
+class Connectable(Observable):
     """
     A mixin class for devices that have network connectivity capabilities,
     like Bluetooth and Wi-Fi.
@@ -26,6 +30,9 @@ class Connectable:
         "802.11ax": "9.6 Gbps",
         "802.11be": "46 Gbps", 
     }
+    # Shared code tables with the formatted '<version>: <speed>' strings precomputed once per code.
+    BLUETOOTH_TABLE = SpecTable({key: f'{key}: {speed}' for key, speed in BLUETOOTH_VERSIONS.items()})
+    WIFI_TABLE = SpecTable({key: f'{key}: {speed}' for key, speed in WIFI_STANDARDS.items()})
 
 
     def __init__(self, bluetooth_version:str, wifi_standard:str):
@@ -43,44 +50,70 @@ class Connectable:
     @property
     def bluetooth_version(self) -> str:
         """Gets the Bluetooth version and its corresponding speed in a formatted string."""
-        key = self.__bluetooth_version
-        value = Connectable.BLUETOOTH_VERSIONS[self.__bluetooth_version]
-        return f'{key}: {value}'
+        return Connectable.BLUETOOTH_TABLE.label(self.__bluetooth_code)
     
     @bluetooth_version.setter
     def bluetooth_version(self, value:str):
         """Sets the Bluetooth version with validation."""
-        string_value = str(value)
-        if string_value not in Connectable.BLUETOOTH_VERSIONS:
+        code = Connectable.BLUETOOTH_TABLE.code(str(value))
+        if code is None:
             raise ValueError('Invalid bluetooth version.')
-        self.__bluetooth_version = string_value
+        old_code = self.__bluetooth_code if self._observers else None
+        self.__bluetooth_code = code
+        self._notify('bluetooth_version', old_code)
+
+    @property
+    def bluetooth_code(self) -> int:
+        """Gets the code of the Bluetooth version in the shared BLUETOOTH_TABLE."""
+        return self.__bluetooth_code
     
 
     @property
     def wifi_standard(self) -> str:
         """Gets the Wi-Fi standard and its corresponding speed in a formatted string."""
-        key = self.__wifi_standard
-        value = Connectable.WIFI_STANDARDS[self.__wifi_standard]
-        return f'{key}: {value}'
+        return Connectable.WIFI_TABLE.label(self.__wifi_code)
     
 
     @wifi_standard.setter
     def wifi_standard(self, value:str) -> None:
         """Sets the Wi-Fi standard with validation."""
-        string_value = str(value)
-        if string_value not in Connectable.WIFI_STANDARDS:
+        code = Connectable.WIFI_TABLE.code(str(value))
+        if code is None:
             raise ValueError('Invalid Wi-Fi version.')
-        self.__wifi_standard = string_value
+        old_code = self.__wifi_code if self._observers else None
+        self.__wifi_code = code
+        self._notify('wifi_standard', old_code)
+
+    @property
+    def wifi_code(self) -> int:
+        """Gets the code of the Wi-Fi standard in the shared WIFI_TABLE."""
+        return self.__wifi_code
 
     def connect_to_wifi(self, name:str) -> None:
         """Connects the device to a Wi-Fi network."""
+        old_connection = (self.__is_connected, self.wifi_name) if self._observers else None
         self.__is_connected = True
         self.wifi_name = name
+        self._notify('connection', old_connection)
 
 
     def disconnect(self) -> None:
         """Disconnects the device from the Wi-Fi network."""
+        old_connection = (self.__is_connected, self.wifi_name) if self._observers else None
         self.__is_connected = False
+        self._notify('connection', old_connection)
+
+
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the Bluetooth, Wi-Fi or connection state, e.g. when undoing a change."""
+        if attribute == 'bluetooth_version':
+            self.__bluetooth_code = old_value
+        elif attribute == 'wifi_standard':
+            self.__wifi_code = old_value
+        elif attribute == 'connection':
+            self.__is_connected, self.wifi_name = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
     
 
     def get_connection_info(self) -> str:
@@ -1,3 +1,6 @@
+from features.spec_table import SpecTable
+
+
 class CapacityMixin:
     """
     A mixin class that provides standardized lists of valid storage and RAM capacities.
@@ -5,4 +8,7 @@ class CapacityMixin:
     """
     STORAGE_CAPACITY = [2 ** gb for gb in range(6,12)] # [64, 128, 256, 512, 1024, 2048]
     RAM_CAPACITY = [2 ** gb for gb in range(2,8)] # [4, 8, 16, 32, 64, 128]
+    # Shared code tables, so devices store a small code instead of the capacity itself.
+    STORAGE_TABLE = SpecTable({gb: f'{gb}GB' for gb in STORAGE_CAPACITY})
+    RAM_TABLE = SpecTable({gb: f'{gb} GB' for gb in RAM_CAPACITY})
 
@@ -0,0 +1,31 @@
+class Observable:
+    """
+    A mixin that lets other objects watch for changes to an object's state.
+    Observers are notified after each change with the attribute name and its previous value.
+    """
+    _observers = () # Shared empty default, so unwatched objects carry no extra state
+
+
+    def _watch(self, observer) -> None:
+        """Registers an observer. The observer must implement _observed_change()."""
+        if not any(current is observer for current in self._observers):
+            self._observers = self._observers + (observer,)
+
+
+    def _unwatch(self, observer) -> None:
+        """Unregisters a previously registered observer."""
+        self._observers = tuple(current for current in self._observers if current is not observer)
+
+
+    def _notify(self, attribute:str, old_value) -> None:
+        """Tells every observer that an attribute has changed."""
+        for observer in self._observers:
+            observer._observed_change(self, attribute, old_value)
+
+
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """
+        Restores an attribute to a value previously passed to observers, without notifying them.
+        Classes override this for their own attributes and delegate the rest to super().
+        """
+        raise ValueError(f'Cannot restore attribute {attribute}.')
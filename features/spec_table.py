@@ -0,0 +1,72 @@
+class SpecTable:
+    """
+    A shared lookup table that maps specification values to small integer codes.
+    Each distinct value and its formatted label are stored only once, so products
+    can keep the integer code instead of their own copy of the string.
+
+    Codes are never released: intern() keeps every value it has seen for the lifetime
+    of the table. Open tables such as Laptop.PROCESSORS therefore grow with each distinct
+    free-form name, so they suit a bounded vocabulary rather than arbitrary user input.
+    """
+    def __init__(self, labels:dict | None = None):
+        """
+        Initializes a SpecTable instance.
+
+        :param labels: Optional mapping of known values to their precomputed labels.
+                       Values are assigned codes in the order of the mapping.
+        """
+        self.__codes = {}
+        self.__values = []
+        self.__labels = []
+        for value, label in (labels or {}).items():
+            self.intern(value, label)
+
+
+    def intern(self, value, label:str | None = None) -> int:
+        """
+        Returns the code of a value, adding it to the table if it is not present yet.
+
+        :param value: The specification value to intern.
+        :param label: The formatted label for a new value. Defaults to str(value).
+        :return: The integer code of the value.
+        """
+        code = self.__codes.get(value)
+        if code is None:
+            code = len(self.__values)
+            self.__codes[value] = code
+            self.__values.append(value)
+            self.__labels.append(str(value) if label is None else label)
+        return code
+
+
+    def code(self, value) -> int | None:
+        """
+        Looks up the code of a value without adding it to the table.
+
+        :return: The integer code, or None if the value is unknown.
+        """
+        return self.__codes.get(value)
+
+
+    def value(self, code:int):
+        """Returns the original value stored under the given code."""
+        return self.__values[code]
+
+
+    def label(self, code:int) -> str:
+        """Returns the precomputed label stored under the given code."""
+        return self.__labels[code]
+
+
+    @property
+    def values(self) -> tuple:
+        """Gets all interned values, indexed by their code."""
+        return tuple(self.__values)
+
+
+    def __contains__(self, value) -> bool:
+        return value in self.__codes
+
+
+    def __len__(self) -> int:
+        return len(self.__values)
@@ -1,6 +1,8 @@
 from products.electronics import Electronics
 from features.battery_powered import BatteryPowered
 from products.product import Product 
+import ranking
+from transaction import Transaction, PRODUCT_ADDED, PRODUCT_REMOVED
 
 class Inventory:
     """
@@ -15,6 +17,27 @@ class Inventory:
         """
         self.name = name
         self.products = {}
+        self.__ranked_indexes = {}
+        self.__is_watching = False # Products are only watched while a ranking is tracked or a transaction is open
+        self.__undo_log = None # (product, attribute, old value) entries while a transaction is open
+        self.__open_transactions = [] # (transaction, savepoint in the undo log), innermost last
+
+
+    @classmethod
+    def import_columnar(cls, name:str, path) -> 'Inventory':
+        """
+        Creates an inventory from an archive written by export_columnar.
+
+        :param name: The name of the store or inventory.
+        :param path: The path of the .npz archive to read.
+        :return: A new Inventory with the restored products.
+        """
+        import columnar # Imported here so numpy is only needed for columnar export and import
+
+        inventory = cls(name)
+        for product in columnar.import_products(path):
+            inventory.add_product(product)
+        return inventory
 
 
     def add_product(self, product) -> bool:
@@ -25,6 +48,12 @@ class Inventory:
         """
         if product.product_id not in self.products:
             self.products[product.product_id] = product
+            if self.__is_watching:
+                product._watch(self)
+            for index in self.__ranked_indexes.values():
+                index.update(product)
+            if self.__undo_log is not None:
+                self.__undo_log.append((product, PRODUCT_ADDED, None))
             return True
         return False
     
@@ -37,7 +66,15 @@ class Inventory:
         :return: True if the product was removed successfully, False otherwise.
         """
         if product_id in self.products:
-            del self.products[product_id]
+            product = self.products.pop(product_id)
+            for index in self.__ranked_indexes.values():
+                index.remove(product_id)
+            if self.__undo_log is None:
+                if self.__is_watching:
+                    product._unwatch(self)
+            else:
+                # Keep watching until commit, so later edits to the product can still be undone
+                self.__undo_log.append((product, PRODUCT_REMOVED, None))
             return True
         return False
     
@@ -101,3 +138,177 @@ class Inventory:
         :return: A list of product objects that match the query.
         """
         return [product for product in self.products.values() if name_query in product.name]
+
+
+    def export_columnar(self, path, chunk_size:int | None = None) -> None:
+        """
+        Exports all products to a columnar NumPy .npz archive, one table per product type.
+        Use columnar.read_columns to load selected columns for analytics.
+        Only Product, Electronics, Laptop, Smartphone and GamingConsole objects can be
+        exported; subclasses of them raise TypeError, since import could not restore them.
+
+        :param path: The path of the archive to create.
+        :param chunk_size: The maximum number of rows written per chunk.
+                           Defaults to columnar.DEFAULT_CHUNK_SIZE.
+        """
+        import columnar # Imported here so numpy is only needed for columnar export and import
+
+        if chunk_size is None:
+            chunk_size = columnar.DEFAULT_CHUNK_SIZE
+        columnar.export_products(self.products.values(), path, chunk_size)
+
+
+    def track_ranking(self, ranking_name:str) -> None:
+        """
+        Keeps a sorted index for a frequently used ranking, so top_k() and get_rank()
+        no longer scan all products. The index is updated as products change.
+
+        :param ranking_name: One of the names in ranking.RANKINGS, e.g. 'price'.
+        """
+        if ranking_name not in self.__ranked_indexes:
+            rank_by = ranking.get_ranking(ranking_name)
+            self.__ranked_indexes[ranking_name] = ranking.RankedIndex(rank_by, self.products.values())
+            self._sync_watching()
+
+
+    def untrack_ranking(self, ranking_name:str) -> None:
+        """Drops the index of a tracked ranking."""
+        self.__ranked_indexes.pop(ranking_name, None)
+        self._sync_watching()
+
+
+    def top_k(self, ranking_name:str, k:int) -> list[Product]:
+        """
+        Returns the k best ranked products without sorting the whole inventory.
+
+        Available rankings: 'price' (most expensive first), 'charge' (lowest charged
+        battery devices first), 'discount' (largest discount from the original price first)
+        and 'warranty_expiration' (soonest expiring active warranties first).
+        :param ranking_name: The name of the ranking.
+        :param k: The number of products to return.
+        :return: A list of at most k products, best ranked first.
+        """
+        if k <= 0:
+            return []
+        index = self.__ranked_indexes.get(ranking_name)
+        if index is not None:
+            return index.top(k, self.products)
+        return ranking.top_k(self.products.values(), ranking.get_ranking(ranking_name), k)
+
+
+    def get_rank(self, ranking_name:str, product_id) -> int | None:
+        """
+        Returns the zero-based position of a product in a ranking.
+
+        :return: The position, or None if the product is not ranked.
+        """
+        index = self.__ranked_indexes.get(ranking_name)
+        if index is not None:
+            return index.rank(product_id, self.products)
+        product = self.products.get(product_id)
+        if product is None:
+            return None
+        return ranking.rank(self.products.values(), ranking.get_ranking(ranking_name), product)
+
+
+    def transaction(self) -> Transaction:
+        """
+        Returns a context manager that applies a batch of edits atomically.
+
+        Products added or removed and attributes changed inside the block are undone
+        if it raises an exception, or if Transaction.rollback() is called:
+
+            with inventory.transaction() as batch:
+                inventory.add_product(laptop)
+                if not laptop.apply_discount(10):
+                    batch.rollback()
+
+        Direct edits to Inventory.products or Product.price_history are not recorded.
+        """
+        return Transaction(self)
+
+
+    def _begin_transaction(self, transaction:Transaction) -> None:
+        """Opens a (possibly nested) transaction, remembering where its edits start in the undo log."""
+        if self.__undo_log is None:
+            self.__undo_log = []
+        self.__open_transactions.append((transaction, len(self.__undo_log)))
+        self._sync_watching()
+
+
+    def _close_transaction(self, transaction:Transaction) -> int:
+        """
+        Removes the innermost open transaction and returns its savepoint.
+        Raises RuntimeError if the given transaction is not the innermost open one.
+        """
+        if not self.__open_transactions or self.__open_transactions[-1][0] is not transaction:
+            raise RuntimeError('Only the innermost open transaction can be committed or rolled back.')
+        return self.__open_transactions.pop()[1]
+
+
+    def _commit_transaction(self, transaction:Transaction) -> None:
+        """Closes a transaction, keeping its edits. The outermost commit clears the undo log."""
+        self._close_transaction(transaction)
+        if not self.__open_transactions:
+            for product, attribute, _ in self.__undo_log:
+                if attribute is PRODUCT_REMOVED and self.products.get(product.product_id) is not product:
+                    product._unwatch(self)
+            self.__undo_log = None
+            self._sync_watching()
+
+
+    def _rollback_transaction(self, transaction:Transaction) -> None:
+        """Closes a transaction, undoing every edit recorded after its savepoint, newest first."""
+        savepoint = self._close_transaction(transaction)
+        undo_log = self.__undo_log
+        changed = {}
+        while len(undo_log) > savepoint:
+            product, attribute, old_value = undo_log.pop()
+            if attribute is PRODUCT_ADDED:
+                del self.products[product.product_id]
+                product._unwatch(self)
+                for index in self.__ranked_indexes.values():
+                    index.remove(product.product_id)
+            elif attribute is PRODUCT_REMOVED:
+                # Watch again, since undoing a later re-add of the same product unwatched it
+                self.products[product.product_id] = product
+                product._watch(self)
+            else:
+                product._restore_attribute(attribute, old_value)
+            changed[product.product_id] = product
+
+        for product_id, product in changed.items():
+            if self.products.get(product_id) is product:
+                for index in self.__ranked_indexes.values():
+                    index.update(product)
+
+        if not self.__open_transactions:
+            self.__undo_log = None
+            self._sync_watching()
+
+
+    def _sync_watching(self) -> None:
+        """
+        Watches every product while a ranking is tracked or a transaction is open,
+        and stops watching once neither is, so plain edits do not call back into the inventory.
+        """
+        should_watch = bool(self.__ranked_indexes or self.__open_transactions)
+        if should_watch == self.__is_watching:
+            return
+        self.__is_watching = should_watch
+        for product in self.products.values():
+            if should_watch:
+                product._watch(self)
+            else:
+                product._unwatch(self)
+
+
+    def _observed_change(self, product, attribute:str, old_value) -> None:
+        """Records the change for an open transaction and updates the affected tracked rankings."""
+        if self.__undo_log is not None:
+            self.__undo_log.append((product, attribute, old_value))
+        if self.products.get(product.product_id) is not product:
+            return
+        for index in self.__ranked_indexes.values():
+            if attribute in index.ranking.attributes:
+                index.update(product)
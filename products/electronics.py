@@ -17,12 +17,47 @@ class Electronics(Product):
         self.__purchase_date = None
 
 
+    @property
+    def warranty_period(self) -> int:
+        """Gets the warranty period in months."""
+        return self.__warranty_period
+
+    @property
+    def purchase_date(self) -> date | None:
+        """Gets the purchase date, or None if the product has not been purchased yet."""
+        return self.__purchase_date
+
+
+    @property
+    def warranty_expiration(self) -> date | None:
+        """Gets the last day of the warranty, or None if the product has not been purchased yet."""
+        if self.__purchase_date is None:
+            return None
+        return self.__purchase_date + relativedelta(months = self.__warranty_period)
+
+
+    def _restore_warranty(self, warranty_period:int, purchase_date:date | None) -> None:
+        """Restores the warranty state, e.g. when loading a saved inventory."""
+        self.__warranty_period = warranty_period
+        self.__purchase_date = purchase_date
+
+
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the purchase date, e.g. when undoing a change."""
+        if attribute == 'purchase_date':
+            self.__purchase_date = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
+
+
     def buy(self) -> None:
         """
         Sets the purchase date to the current date, simulating a purchase.
         This action starts the warranty period.
         """
+        old_purchase_date = self.__purchase_date if self._observers else None
         self.__purchase_date = date.today()
+        self._notify('purchase_date', old_purchase_date)
     
 
     def is_warranty_active(self) -> bool:
@@ -32,9 +67,9 @@ class Electronics(Product):
         :return: True if the warranty is active, False if it has expired
                  or if the product has not been purchased yet.
         """
-        if self.__purchase_date is None:
+        warranty_expiration = self.warranty_expiration
+        if warranty_expiration is None:
             return False
-        warranty_expiration = self.__purchase_date + relativedelta(months = self.__warranty_period)
         return date.today() <= warranty_expiration
 
 
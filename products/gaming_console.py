@@ -1,5 +1,6 @@
 from products.electronics import Electronics
 from features.mixin import CapacityMixin
+from features.spec_table import SpecTable
 
 
 class GamingConsole(Electronics, CapacityMixin):
@@ -7,6 +8,8 @@ class GamingConsole(Electronics, CapacityMixin):
     Represents a gaming console, inheriting from Electronics and using CapacityMixin.
     Adds specific attributes like controller type and storage.
     """
+    CONTROLLER_TYPES = SpecTable() # Shared table of controller types, grown as new ones appear
+
     def __init__(self, name:str, price:int|float, controller_type:str, storage_gb:int):
         """
         Initializes a GamingConsole instance.
@@ -24,28 +27,47 @@ class GamingConsole(Electronics, CapacityMixin):
     @property
     def storage_gb(self) -> int:
         """Gets the storage capacity in GB."""
-        return self.__storage_gb
+        return self.STORAGE_TABLE.value(self.__storage_code)
 
     @storage_gb.setter
     def storage_gb(self, value:int):
         """Sets the storage capacity with validation against allowed values."""
         if not isinstance(value, int):
             raise ValueError('Capacity must be a numeric value.')
-        if value not in self.STORAGE_CAPACITY:
-            raise ValueError(f'Capacity must be a value from the range {", ".join(str(gb) for gb in self.STORAGE_CAPACITY)} GB')
-        self.__storage_gb = value
+        code = self.STORAGE_TABLE.code(value)
+        if code is None:
+            raise ValueError(f'Capacity must be a value from the range {", ".join(str(gb) for gb in self.STORAGE_TABLE.values)} GB')
+        old_code = self.__storage_code if self._observers else None
+        self.__storage_code = code
+        self._notify('storage_gb', old_code)
 
     @property
     def controller_type(self) -> str:
         """Gets the controller type."""
-        return self.__controller_type
+        return GamingConsole.CONTROLLER_TYPES.value(self.__controller_code)
 
     @controller_type.setter
     def controller_type(self, value:str) -> None:
         """Sets the controller type."""
         if not value:
             raise ValueError('The controller type cannot be an empty string.')
-        self.__controller_type = str(value)
+        old_code = self.__controller_code if self._observers else None
+        self.__controller_code = GamingConsole.CONTROLLER_TYPES.intern(str(value))
+        self._notify('controller_type', old_code)
+
+    @property
+    def controller_code(self) -> int:
+        """Gets the code of the controller type in the shared CONTROLLER_TYPES table."""
+        return self.__controller_code
+
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the storage or controller code, e.g. when undoing a change."""
+        if attribute == 'storage_gb':
+            self.__storage_code = old_value
+        elif attribute == 'controller_type':
+            self.__controller_code = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
 
     def pair_new_controller(self, new_controller_type:str) -> None:
         """Updates the controller type to a new one."""
@@ -59,7 +81,7 @@ class GamingConsole(Electronics, CapacityMixin):
         :param game_name: The name of the game to be played.
         :return: A string describing the action.
         """
-        return f'{game_name} played on {self.name} with {self.__controller_type} controller!'
+        return f'{game_name} played on {self.name} with {self.controller_type} controller!'
 
 
     def get_details(self) -> str:
@@ -67,6 +89,7 @@ class GamingConsole(Electronics, CapacityMixin):
         Overrides the parent method to include console-specific details.
         """
         electronics_details = super().get_details()
-        return f'{electronics_details}, Controller: {self.__controller_type}, Storage: {self.__storage_gb}GB'
+        controller = GamingConsole.CONTROLLER_TYPES.label(self.__controller_code)
+        return f'{electronics_details}, Controller: {controller}, Storage: {self.STORAGE_TABLE.label(self.__storage_code)}'
 
 
@@ -1,6 +1,7 @@
 from products.electronics import Electronics
 from features.battery_powered import BatteryPowered
 from features.mixin import CapacityMixin
+from features.spec_table import SpecTable
 
 
 class Laptop(Electronics, BatteryPowered, CapacityMixin):
@@ -8,6 +9,8 @@ class Laptop(Electronics, BatteryPowered, CapacityMixin):
     Represents a laptop, inheriting from Electronics, BatteryPowered, and CapacityMixin.
     This class demonstrates multiple inheritance.
     """
+    PROCESSORS = SpecTable() # Shared table of processor names, grown as new ones appear
+
     def __init__(self, name:str, price:int, battery_capacity_mah:int, processor:str, ram:int):
         """
         Initializes a Laptop instance.
@@ -33,31 +36,51 @@ class Laptop(Electronics, BatteryPowered, CapacityMixin):
     @property
     def ram(self) -> int:
         """Gets the amount of RAM in GB."""
-        return self.__ram 
+        return self.RAM_TABLE.value(self.__ram_code)
 
     @ram.setter
     def ram(self, value) -> None:
         """Sets the RAM size with validation against allowed values."""  
         if not isinstance(value, int):
             raise ValueError('RAM must be a numeric value.')
-        if value not in self.RAM_CAPACITY:
-            raise ValueError(f'Invalid RAM size. Must be one of {", ".join(str(gb) for gb in self.RAM_CAPACITY)} GB')
-        self.__ram = value
+        code = self.RAM_TABLE.code(value)
+        if code is None:
+            raise ValueError(f'Invalid RAM size. Must be one of {", ".join(str(gb) for gb in self.RAM_TABLE.values)} GB')
+        old_code = self.__ram_code if self._observers else None
+        self.__ram_code = code
+        self._notify('ram', old_code)
 
 
     @property
     def processor(self) -> str:
         """Gets the processor type."""
-        return self.__processor
+        return Laptop.PROCESSORS.value(self.__processor_code)
 
     @processor.setter 
     def processor(self, value) -> None:
         """Sets the processor type."""
         if not value:
             raise ValueError('The processor name cannot be an empty string.')
-        self.__processor = str(value)
+        old_code = self.__processor_code if self._observers else None
+        self.__processor_code = Laptop.PROCESSORS.intern(str(value))
+        self._notify('processor', old_code)
+
+    @property
+    def processor_code(self) -> int:
+        """Gets the code of the processor in the shared PROCESSORS table."""
+        return self.__processor_code
     
 
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the RAM or processor code, e.g. when undoing a change."""
+        if attribute == 'ram':
+            self.__ram_code = old_value
+        elif attribute == 'processor':
+            self.__processor_code = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
+
+
     def upgrade_ram(self, additional_ram):
         """
         Upgrades the RAM to a new, larger size.
@@ -65,7 +88,7 @@ class Laptop(Electronics, BatteryPowered, CapacityMixin):
         :param new_ram_size: The new total size of the RAM.
         :return: True if the upgrade was successful, False otherwise.
         """
-        if additional_ram > self.__ram:
+        if additional_ram > self.ram:
             self.ram = additional_ram
 
 
@@ -76,5 +99,6 @@ class Laptop(Electronics, BatteryPowered, CapacityMixin):
         :return: A formatted string with all product details.
         """
         electronics_details = super().get_details()
-        return f'{electronics_details}, Processor: {self.__processor}, RAM: {self.__ram} GB'
+        processor = Laptop.PROCESSORS.label(self.__processor_code)
+        return f'{electronics_details}, Processor: {processor}, RAM: {self.RAM_TABLE.label(self.__ram_code)}'
 
@@ -1,4 +1,7 @@
-class Product:
+from features.observable import Observable
+
+
+class Product(Observable):
     """
     The base class for all products in the inventory system.
     Handles basic attributes like name, price, and a unique ID.
@@ -31,7 +34,9 @@ class Product:
         """Sets the product's name with validation."""
         if not value:
             raise ValueError('The name must contain at least one character!')
+        old_name = self.__name if self._observers else None
         self.__name = value
+        self._notify('name', old_name)
 
     @property
     def price(self) -> float:
@@ -49,15 +54,39 @@ class Product:
         if value <= 0:
             raise ValueError('Price must be a positive value greater than 0.')
 
+        old_price = self.__price if self._observers else None
         self.__price = value
         self.price_history.append(value)
+        self._notify('price_history', len(self.price_history) - 1)
+        self._notify('price', old_price)
         
     @property
     def product_id(self) -> int:
         """Gets the unique ID of the product."""
         return self.__product_id
+
+
+    def _restore_id(self, product_id:int) -> None:
+        """
+        Restores a previously assigned ID, e.g. when loading a saved inventory.
+        Keeps the ID counter ahead of restored IDs so new products stay unique.
+        """
+        self.__product_id = product_id
+        Product._ID = max(Product._ID, product_id)
     
 
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the name, price or price history length, e.g. when undoing a change."""
+        if attribute == 'name':
+            self.__name = old_value
+        elif attribute == 'price':
+            self.__price = old_value
+        elif attribute == 'price_history':
+            del self.price_history[old_value:]
+        else:
+            super()._restore_attribute(attribute, old_value)
+
+
     def apply_discount(self, percentage:int|float) -> bool:
         """
         Applies a discount to the product's price.
@@ -69,7 +98,9 @@ class Product:
         if not (percentage > 0 and percentage <= Product.MAX_DISCOUNT_PERCENTAGE):
             return False
 
+        old_price = self.__price if self._observers else None
         self.__price *= (1 - percentage / 100)
+        self._notify('price', old_price)
         return True
 
 
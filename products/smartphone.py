@@ -38,7 +38,9 @@ class Smartphone(Electronics, Connectable, BatteryPowered):
         """Sets the screen size with validation."""
         if not isinstance(value, (float,int)):
             raise ValueError('The display size must be a numeric value.')
+        old_size = self.__screen_size if self._observers else None
         self.__screen_size = value
+        self._notify('screen_size', old_size)
 
     @property
     def camera_megapixels(self) -> int:
@@ -50,7 +52,19 @@ class Smartphone(Electronics, Connectable, BatteryPowered):
         """Sets the camera resolution with validation."""
         if not isinstance(value, (int)):
             raise ValueError('Resolution must be a numeric value.')
+        old_resolution = self.__camera_megapixels if self._observers else None
         self.__camera_megapixels = value
+        self._notify('camera_megapixels', old_resolution)
+
+
+    def _restore_attribute(self, attribute:str, old_value) -> None:
+        """Restores the screen size or camera resolution, e.g. when undoing a change."""
+        if attribute == 'screen_size':
+            self.__screen_size = old_value
+        elif attribute == 'camera_megapixels':
+            self.__camera_megapixels = old_value
+        else:
+            super()._restore_attribute(attribute, old_value)
 
 
     def take_photo(self) -> str:
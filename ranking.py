@@ -0,0 +1,218 @@
+"""
+Ranked (top-K) queries over inventory products.
+
+One-off queries use a heap, so they run in O(n log k) instead of sorting every product.
+Frequently used rankings can be tracked with a RankedIndex, a sorted list that is kept
+up to date as products are added, removed or changed.
+"""
+import heapq
+from bisect import bisect_left, insort
+
+from features.battery_powered import BatteryPowered
+from products.electronics import Electronics
+
+
+class Ranking:
+    """
+    Describes how products are ranked.
+    The key returns None for products that do not take part in the ranking.
+    """
+    def __init__(self, key, largest:bool, attributes:tuple[str, ...], time_dependent:bool = False):
+        """
+        Initializes a Ranking instance.
+
+        :param key: A function returning the sort key of a product, or None to skip it.
+        :param largest: True if the highest keys come first, False for the lowest keys.
+        :param attributes: The product attributes whose changes affect the key.
+        :param time_dependent: True if keys can change as time passes, without any product
+                               attribute changing, e.g. when a warranty lapses.
+        """
+        self.key = key
+        self.largest = largest
+        self.attributes = attributes
+        self.time_dependent = time_dependent
+
+
+def _discount(product) -> float | None:
+    """Returns how much cheaper a product is than its original price, or None if not discounted."""
+    if not product.price_history:
+        return None
+    discount = product.price_history[0] - product.price
+    return discount if discount > 0 else None
+
+
+def _charge(product) -> int | None:
+    """Returns the battery charge of a battery powered product."""
+    if not isinstance(product, BatteryPowered):
+        return None
+    return product.current_charge_percentage
+
+
+def _active_warranty_expiration(product):
+    """Returns the warranty expiration date of an electronics product with an active warranty."""
+    if not isinstance(product, Electronics) or not product.is_warranty_active():
+        return None
+    return product.warranty_expiration
+
+
+RANKINGS = {
+    'price': Ranking(lambda product: product.price, largest=True, attributes=('price',)),
+    'charge': Ranking(_charge, largest=False, attributes=('current_charge_percentage',)),
+    'discount': Ranking(_discount, largest=True, attributes=('price',)),
+    'warranty_expiration': Ranking(_active_warranty_expiration, largest=False, attributes=('purchase_date',),
+                                   time_dependent=True),
+}
+
+
+def get_ranking(name:str) -> Ranking:
+    """Returns the ranking with the given name, raising ValueError if it is unknown."""
+    if name not in RANKINGS:
+        raise ValueError(f'Unknown ranking. Must be one of {", ".join(RANKINGS)}')
+    return RANKINGS[name]
+
+
+def top_k(products, ranking:Ranking, k:int) -> list:
+    """
+    Returns the first k products of a ranking using a heap.
+
+    :param products: The products to rank.
+    :param ranking: The ranking to apply.
+    :param k: The number of products to return.
+    :return: A list of at most k products, best ranked first.
+    """
+    keyed = ((key, product.product_id, product) for product in products
+             if (key := ranking.key(product)) is not None)
+    select = heapq.nlargest if ranking.largest else heapq.nsmallest
+    # Product IDs are unique, so ties never fall through to comparing the products themselves
+    return [product for _, _, product in select(k, keyed)]
+
+
+def rank(products, ranking:Ranking, product) -> int | None:
+    """
+    Returns the zero-based position of a product in a ranking by counting the
+    products ranked before it, without sorting.
+
+    :return: The position, or None if the product is not ranked.
+    """
+    key = ranking.key(product)
+    if key is None:
+        return None
+    entry = (key, product.product_id)
+    position = 0
+    for other in products:
+        other_key = ranking.key(other)
+        if other_key is None:
+            continue
+        other_entry = (other_key, other.product_id)
+        if (other_entry > entry) if ranking.largest else (other_entry < entry):
+            position += 1
+    return position
+
+
+class RankedIndex:
+    """
+    An order-statistics index that keeps products sorted by a ranking.
+    Entries are (key, product_id) pairs in ascending order.
+    """
+    def __init__(self, ranking:Ranking, products):
+        """
+        Initializes a RankedIndex instance.
+
+        :param ranking: The ranking to maintain.
+        :param products: The products to index initially.
+        """
+        self.ranking = ranking
+        self.__keys = {}
+        for product in products:
+            key = ranking.key(product)
+            if key is not None:
+                self.__keys[product.product_id] = key
+        self.__entries = sorted((key, product_id) for product_id, key in self.__keys.items())
+
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+    def remove(self, product_id:int) -> None:
+        """Removes a product from the index, if present."""
+        key = self.__keys.pop(product_id, None)
+        if key is not None:
+            del self.__entries[bisect_left(self.__entries, (key, product_id))]
+
+
+    def update(self, product) -> None:
+        """Adds a product or moves it to the position matching its current key."""
+        product_id = product.product_id
+        key = self.ranking.key(product)
+        if self.__keys.get(product_id) == key:
+            return
+        self.remove(product_id)
+        if key is not None:
+            self.__keys[product_id] = key
+            insort(self.__entries, (key, product_id))
+
+
+    def rank(self, product_id:int, products:dict) -> int | None:
+        """
+        Returns the zero-based position of a product in the ranking.
+
+        The product's stored key is checked against its current key first, so a product
+        that changed without notification is re-indexed. For time dependent rankings the
+        entries ahead of it are rechecked as well, so lapsed warranties are not counted.
+        :param product_id: The ID of the product.
+        :param products: The inventory's mapping of product IDs to products.
+        :return: The position, or None if the product is not ranked.
+        """
+        product = products.get(product_id)
+        if product is None:
+            self.remove(product_id)
+            return None
+        self.update(product)
+        key = self.__keys.get(product_id)
+        if key is None:
+            return None
+        if self.ranking.time_dependent:
+            return len(self.__valid_products(products, until=(key, product_id)))
+        position = bisect_left(self.__entries, (key, product_id))
+        return len(self.__entries) - 1 - position if self.ranking.largest else position
+
+
+    def top(self, k:int, products:dict) -> list:
+        """
+        Returns the first k products of the ranking.
+
+        Visited entries are checked against their current key, so products that
+        changed without notification (e.g. warranties expiring over time) are re-indexed.
+        :param k: The number of products to return.
+        :param products: The inventory's mapping of product IDs to products.
+        :return: A list of at most k products, best ranked first.
+        """
+        return self.__valid_products(products, limit=k)
+
+
+    def __valid_products(self, products:dict, limit:int | None = None, until:tuple | None = None) -> list:
+        """
+        Walks the entries best ranked first and returns their products, stopping after
+        `limit` products or at the entry `until`. Entries whose stored key no longer matches
+        the product are re-indexed and the walk is repeated.
+        """
+        while True:
+            result, stale = [], []
+            entries = reversed(self.__entries) if self.ranking.largest else iter(self.__entries)
+            for entry in entries:
+                if len(result) == limit or entry == until:
+                    break
+                key, product_id = entry
+                product = products.get(product_id)
+                if product is None or self.ranking.key(product) != key:
+                    stale.append((product_id, product))
+                    continue
+                result.append(product)
+            if not stale:
+                return result
+            for product_id, product in stale:
+                if product is None:
+                    self.remove(product_id)
+                else:
+                    self.update(product)
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from datetime import date
+from unittest import mock
+
+import numpy as np
+
+import columnar
+from inventory import Inventory
+from products.electronics import Electronics
+from products.gaming_console import GamingConsole
+from products.laptop import Laptop
+from products.product import Product
+from products.smartphone import Smartphone
+
+
+class ColumnarTest(unittest.TestCase):
+    """Tests for the columnar .npz export and import."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'inventory.npz')
+
+        self.inventory = Inventory('Test Store')
+        self.product = Product('Gift Card', 50)
+        self.electronics = Electronics('Charger', 40)
+        self.laptop = Laptop('Ultrabook Pro X1', 2800, 5000, 'Intel Core i7-12700H', 16)
+        self.smartphone = Smartphone('Galaxy Supernova', 1950, '5.3', '802.11ax', 4800, 6.7, 108)
+        self.console = GamingConsole('PlayStation 6', 1100, 'DualSense Edge', 1024)
+
+        self.laptop.price = 2600
+        self.laptop.apply_discount(10)
+        self.laptop.buy()
+        self.laptop.use_device(hours=2, power=500)
+        self.smartphone._restore_warranty(24, date(2024, 5, 17))
+        self.smartphone.use_device(hours=5, power=200)
+        for product in (self.product, self.electronics, self.laptop, self.smartphone, self.console):
+            self.inventory.add_product(product)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_round_trip_restores_every_product_type(self):
+        self.inventory.export_columnar(self.path, chunk_size=1)
+        restored = Inventory.import_columnar('Restored Store', self.path)
+
+        self.assertEqual(sorted(restored.products), sorted(self.inventory.products))
+        for product_id, original in self.inventory.products.items():
+            copy = restored.find_product(product_id)
+            self.assertIs(type(copy), type(original))
+            self.assertEqual(copy.get_details(), original.get_details())
+            self.assertEqual(copy.price_history, original.price_history)
+            if isinstance(original, Electronics):
+                self.assertEqual(copy.purchase_date, original.purchase_date)
+            if isinstance(original, (Laptop, Smartphone)):
+                self.assertEqual(copy.current_charge_percentage, original.current_charge_percentage)
+                self.assertEqual(copy.battery_capacity_mah, original.battery_capacity_mah)
+
+        smartphone = restored.find_product(self.smartphone.product_id)
+        self.assertEqual(smartphone.bluetooth_version, self.smartphone.bluetooth_version)
+        self.assertEqual(smartphone.wifi_standard, self.smartphone.wifi_standard)
+        laptop = restored.find_product(self.laptop.product_id)
+        self.assertEqual(laptop.price_history, [2800, 2600])
+        self.assertAlmostEqual(laptop.price, 2340)
+
+
+    def test_read_columns_returns_only_selected_columns(self):
+        self.inventory.export_columnar(self.path, chunk_size=1)
+        columns = columnar.read_columns(self.path, 'laptop', ['product_id', 'processor', 'ram'])
+
+        self.assertEqual(list(columns), ['product_id', 'processor', 'ram'])
+        self.assertEqual(columns['product_id'].tolist(), [self.laptop.product_id])
+        self.assertEqual(columns['processor'].tolist(), ['Intel Core i7-12700H'])
+        self.assertEqual(columns['ram'].tolist(), [16])
+        with self.assertRaises(ValueError):
+            columnar.read_columns(self.path, 'laptop', ['screen_size'])
+
+
+    def test_large_battery_capacity_is_exported(self):
+        self.inventory.add_product(Laptop('Power Bank Laptop', 100, 3_000_000_000, 'CPU', 16))
+        self.inventory.export_columnar(self.path)
+        columns = columnar.read_columns(self.path, 'laptop', ['battery_capacity_mah'])
+        self.assertIn(3_000_000_000, columns['battery_capacity_mah'].tolist())
+
+
+    def test_failed_export_keeps_previous_archive(self):
+        self.inventory.export_columnar(self.path)
+        with open(self.path, 'rb') as file:
+            previous = file.read()
+
+        write_array = columnar._write_array
+        calls = []
+        def failing_write_array(archive, key, array):
+            calls.append(key)
+            if len(calls) == 5:
+                raise OSError('Disk full')
+            write_array(archive, key, array)
+
+        with mock.patch('columnar._write_array', failing_write_array):
+            with self.assertRaises(OSError):
+                self.inventory.export_columnar(self.path)
+        self.assertEqual(os.listdir(self.directory.name), ['inventory.npz'])
+        with open(self.path, 'rb') as file:
+            self.assertEqual(file.read(), previous)
+
+
+    def test_subclasses_are_rejected(self):
+        class CustomLaptop(Laptop):
+            pass
+        self.inventory.add_product(CustomLaptop('Custom', 100, 5000, 'CPU', 16))
+        with self.assertRaises(TypeError):
+            self.inventory.export_columnar(self.path)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+    def test_unknown_or_missing_format_version_is_rejected(self):
+        for version in (2, None):
+            with zipfile.ZipFile(self.path, 'w') as archive:
+                if version is not None:
+                    with archive.open('format_version.npy', 'w') as file:
+                        np.lib.format.write_array(file, np.array(version))
+                else:
+                    with archive.open('laptop.ram.00000.npy', 'w') as file:
+                        np.lib.format.write_array(file, np.array([16]))
+            with self.assertRaises(ValueError):
+                Inventory.import_columnar('Restored Store', self.path)
+            with self.assertRaises(ValueError):
+                columnar.read_columns(self.path, 'laptop')
+
+
+if __name__ == '__main__':
+    unittest.main()
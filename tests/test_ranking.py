@@ -0,0 +1,110 @@
+import random
+import unittest
+from datetime import date
+from unittest import mock
+
+import ranking
+from inventory import Inventory
+from products.gaming_console import GamingConsole
+from products.laptop import Laptop
+from products.smartphone import Smartphone
+
+
+def fake_today(today:date):
+    """Patches date.today() as seen by the products, so warranties can lapse in a test."""
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return today
+    return mock.patch('products.electronics.date', FakeDate)
+
+
+class RankingTest(unittest.TestCase):
+    """Tests that tracked rankings answer the same as the one-off heap and scan queries."""
+
+    def setUp(self):
+        random.seed(7)
+        self.tracked = Inventory('Tracked Store')
+        self.untracked = Inventory('Untracked Store')
+        for name in ranking.RANKINGS:
+            self.tracked.track_ranking(name)
+
+        self.products = []
+        for index in range(60):
+            price = random.randint(100, 3000)
+            if index % 3 == 0:
+                product = Laptop('Laptop', price, 5000, 'Intel Core i7-12700H', 16)
+            elif index % 3 == 1:
+                product = Smartphone('Phone', price, '5.3', '802.11ax', 4800, 6.7, 108)
+            else:
+                product = GamingConsole('Console', price, 'DualSense Edge', 1024)
+            self.products.append(product)
+            self.tracked.add_product(product)
+            self.untracked.add_product(product)
+
+
+    def assert_same_rankings(self):
+        for name in ranking.RANKINGS:
+            self.assertEqual(self.tracked.top_k(name, 10), self.untracked.top_k(name, 10), name)
+            for product in self.products:
+                self.assertEqual(self.tracked.get_rank(name, product.product_id),
+                                 self.untracked.get_rank(name, product.product_id), name)
+
+
+    def test_tracked_rankings_follow_product_changes(self):
+        for _ in range(200):
+            product = random.choice(self.products)
+            action = random.randint(0, 4)
+            if action == 0:
+                product.apply_discount(random.randint(1, 50))
+            elif action == 1:
+                product.price = random.randint(100, 3000)
+            elif action == 2 and not isinstance(product, GamingConsole):
+                product.use_device(hours=1, power=random.randint(100, 3000))
+            elif action == 3:
+                product.buy()
+            else:
+                self.tracked.remove_product(product.product_id)
+                self.untracked.remove_product(product.product_id)
+        self.assert_same_rankings()
+
+
+    def test_top_k_matches_full_sort(self):
+        expected = sorted(self.products, key=lambda product: (product.price, product.product_id), reverse=True)
+        self.assertEqual(self.tracked.top_k('price', 5), expected[:5])
+        self.assertEqual(self.untracked.top_k('price', 5), expected[:5])
+
+
+    def test_lapsed_warranty_ahead_is_not_counted(self):
+        first, second = self.products[0], self.products[1]
+        first._restore_warranty(24, date(2020, 1, 1))
+        second._restore_warranty(24, date(2021, 1, 1))
+        inventory = Inventory('Warranty Store')
+        inventory.add_product(first)
+        inventory.add_product(second)
+
+        with fake_today(date(2021, 6, 1)):
+            inventory.track_ranking('warranty_expiration')
+            self.assertEqual(inventory.get_rank('warranty_expiration', second.product_id), 1)
+
+        with fake_today(date(2022, 6, 1)):
+            untracked_rank = ranking.rank(inventory.products.values(), ranking.RANKINGS['warranty_expiration'], second)
+            self.assertEqual(untracked_rank, 0)
+            self.assertEqual(inventory.get_rank('warranty_expiration', second.product_id), 0)
+            self.assertIsNone(inventory.get_rank('warranty_expiration', first.product_id))
+            self.assertEqual(inventory.top_k('warranty_expiration', 5), [second])
+
+
+    def test_products_are_only_watched_while_needed(self):
+        self.assertEqual(self.products[0]._observers, (self.tracked,))
+        for name in ranking.RANKINGS:
+            self.tracked.untrack_ranking(name)
+        self.assertEqual(self.products[0]._observers, ())
+
+        with self.untracked.transaction():
+            self.assertEqual(self.products[0]._observers, (self.untracked,))
+        self.assertEqual(self.products[0]._observers, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from features.connectable import Connectable
+from products.gaming_console import GamingConsole
+from products.laptop import Laptop
+from products.smartphone import Smartphone
+
+
+class SpecTableTest(unittest.TestCase):
+    """Tests that products backed by SpecTable codes keep their previous output."""
+
+    def test_connectable_getters_for_every_code(self):
+        for bluetooth, bluetooth_speed in Connectable.BLUETOOTH_VERSIONS.items():
+            for wifi, wifi_speed in Connectable.WIFI_STANDARDS.items():
+                phone = Smartphone('Galaxy Supernova', 1950, bluetooth, wifi, 4800, 6.7, 108)
+                self.assertEqual(phone.bluetooth_version, f'{bluetooth}: {bluetooth_speed}')
+                self.assertEqual(phone.wifi_standard, f'{wifi}: {wifi_speed}')
+                self.assertEqual(phone.get_details(),
+                                 f'ID: {phone.product_id}, Name: Galaxy Supernova, Price: 1950.00$, '
+                                 f'Warranty: 24 months, Screen Size: 6.7, Camera: 108MPX')
+
+
+    def test_invalid_versions_are_rejected(self):
+        with self.assertRaises(ValueError):
+            Smartphone('Phone', 100, '9.9', '802.11ax', 4800, 6.7, 108)
+        with self.assertRaises(ValueError):
+            Smartphone('Phone', 100, '5.3', '802.11zz', 4800, 6.7, 108)
+
+
+    def test_laptop_and_console_details(self):
+        laptop = Laptop('Ultrabook Pro X1', 2800, 5000, 'Intel Core i7-12700H', 16)
+        self.assertEqual(laptop.processor, 'Intel Core i7-12700H')
+        self.assertEqual(laptop.ram, 16)
+        self.assertEqual(laptop.get_details(),
+                         f'ID: {laptop.product_id}, Name: Ultrabook Pro X1, Price: 2800.00$, '
+                         f'Warranty: 24 months, Processor: Intel Core i7-12700H, RAM: 16 GB')
+
+        console = GamingConsole('PlayStation 6', 1100, 'DualSense Edge', 1024)
+        self.assertEqual(console.storage_gb, 1024)
+        self.assertEqual(console.get_details(),
+                         f'ID: {console.product_id}, Name: PlayStation 6, Price: 1100.00$, '
+                         f'Warranty: 24 months, Controller: DualSense Edge, Storage: 1024GB')
+
+
+    def test_capacity_errors_list_table_values(self):
+        with self.assertRaisesRegex(ValueError, 'Must be one of 4, 8, 16, 32, 64, 128 GB'):
+            Laptop('Laptop', 100, 5000, 'CPU', 3)
+        with self.assertRaisesRegex(ValueError, '64, 128, 256, 512, 1024, 2048 GB'):
+            GamingConsole('Console', 100, 'Pad', 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
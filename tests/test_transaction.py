@@ -0,0 +1,79 @@
+import unittest
+
+from inventory import Inventory
+from products.laptop import Laptop
+
+
+class TransactionTest(unittest.TestCase):
+    """Tests for Inventory.transaction() commit and rollback."""
+
+    def setUp(self):
+        self.inventory = Inventory('Test Store')
+        self.laptop = Laptop('Ultrabook Pro X1', 2800, 5000, 'Intel Core i7-12700H', 16)
+        self.inventory.add_product(self.laptop)
+
+
+    def test_exception_rolls_back_all_edits(self):
+        other = Laptop('WorkBook Basic', 1300, 3500, 'AMD Ryzen 5', 8)
+        with self.assertRaises(ValueError):
+            with self.inventory.transaction():
+                self.inventory.add_product(other)
+                self.laptop.apply_discount(10)
+                self.laptop.price = 2000
+                self.laptop.ram = 3
+        self.assertNotIn(other.product_id, self.inventory.products)
+        self.assertEqual(self.laptop.price, 2800)
+        self.assertEqual(self.laptop.price_history, [2800])
+        self.assertEqual(self.laptop.ram, 16)
+
+
+    def test_commit_keeps_edits(self):
+        with self.inventory.transaction():
+            self.laptop.ram = 32
+            self.inventory.remove_product(self.laptop.product_id)
+        self.assertEqual(self.laptop.ram, 32)
+        self.assertNotIn(self.laptop.product_id, self.inventory.products)
+        self.assertEqual(self.laptop._observers, ())
+
+
+    def test_rollback_of_remove_and_re_add_keeps_product_watched(self):
+        with self.inventory.transaction() as transaction:
+            self.inventory.remove_product(self.laptop.product_id)
+            self.inventory.add_product(self.laptop)
+            transaction.rollback()
+        self.assertIs(self.inventory.find_product(self.laptop.product_id), self.laptop)
+
+        with self.inventory.transaction() as transaction:
+            self.laptop.price = 7
+            transaction.rollback()
+        self.assertEqual(self.laptop.price, 2800)
+
+
+    def test_inner_rollback_only_undoes_inner_edits(self):
+        with self.inventory.transaction():
+            self.laptop.price = 2500
+            with self.inventory.transaction() as inner:
+                self.laptop.ram = 32
+                inner.rollback()
+        self.assertEqual(self.laptop.price, 2500)
+        self.assertEqual(self.laptop.ram, 16)
+
+
+    def test_only_innermost_transaction_can_close(self):
+        outer = self.inventory.transaction()
+        inner = self.inventory.transaction()
+        outer.__enter__()
+        inner.__enter__()
+        with self.assertRaises(RuntimeError):
+            outer.commit()
+        self.assertTrue(outer.is_open)
+
+        self.laptop.price = 7
+        inner.rollback()
+        self.assertEqual(self.laptop.price, 2800)
+        outer.commit()
+        self.assertFalse(outer.is_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# Undo log markers for products added to or removed from the inventory.
+# Unique objects, so they can never clash with an attribute name passed to _notify().
+PRODUCT_ADDED = object()
+PRODUCT_REMOVED = object()
+
+
+class Transaction:
+    """
+    A context manager that groups inventory edits so they are applied all together or not at all.
+
+    While a transaction is open, the inventory records a compact undo entry for every
+    product added or removed and for every product attribute changed. Leaving the block
+    normally commits the edits; an exception rolls them back in time proportional to the
+    number of changes, and is then re-raised. Transactions can be nested; an inner
+    rollback only undoes the edits made inside the inner block.
+    """
+    def __init__(self, inventory):
+        """
+        Initializes a Transaction instance.
+
+        :param inventory: The inventory whose edits are grouped.
+        """
+        self.__inventory = inventory
+        self.__is_open = False
+
+
+    def __enter__(self) -> 'Transaction':
+        if self.__is_open:
+            raise RuntimeError('The transaction is already open.')
+        self.__inventory._begin_transaction(self)
+        self.__is_open = True
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self.__is_open:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        return False
+
+
+    @property
+    def is_open(self) -> bool:
+        """Returns True until the transaction is committed or rolled back."""
+        return self.__is_open
+
+
+    def commit(self) -> None:
+        """
+        Keeps all edits made in the transaction.
+        Raises RuntimeError if it is not the innermost open transaction.
+        """
+        if not self.__is_open:
+            raise RuntimeError('The transaction is not open.')
+        self.__inventory._commit_transaction(self)
+        self.__is_open = False
+
+
+    def rollback(self) -> None:
+        """
+        Undoes all edits made in the transaction, e.g. after an operation returned False.
+        Raises RuntimeError if it is not the innermost open transaction.
+        """
+        if not self.__is_open:
+            raise RuntimeError('The transaction is not open.')
+        self.__inventory._rollback_transaction(self)
+        self.__is_open = False